@@ -1,15 +1,20 @@
 """Command-line interface for babbl."""
 
+import os
 import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import click
 
-from babbl.parser import BabblParser
-from babbl.renderer import HTMLRenderer
 from babbl.util import load_file, load_metadata, save_file
 
+if TYPE_CHECKING:
+    # imported inside the commands that need them so `babbl --help` stays fast
+    from babbl.parser import BabblParser
+    from babbl.renderer import HTMLRenderer
+
 
 @click.group()
 @click.version_option()
@@ -36,12 +41,15 @@ def render(
     base_path: Optional[Path],
 ):
     """Render a markdown file to HTML."""
+    from babbl.parser import get_default_parser
+    from babbl.renderer import HTMLRenderer
+
     if output is None:
         output_path = input_file.with_suffix(".html")
     else:
         output_path = output
 
-    parser = BabblParser()
+    parser = get_default_parser()
     renderer = HTMLRenderer(
         css_file_path=css,
         show_toc=toc,
@@ -64,6 +72,43 @@ def render(
         raise click.Abort()
 
 
+# builds with fewer files than this are rendered in-process to skip worker startup
+MIN_PARALLEL_FILES = 4
+
+_worker_parser: Optional["BabblParser"] = None
+_worker_renderer: Optional["HTMLRenderer"] = None
+
+
+def _init_build_worker(css: Optional[str], toc: bool, base_path: Optional[Path], output_dir: Path) -> None:
+    """Create the parser and renderer shared by every file a build worker processes.
+
+    The CSS is passed as text already read by build(), so a bad --css path is reported once up front.
+    """
+    global _worker_parser, _worker_renderer
+    from babbl.parser import get_default_parser
+    from babbl.renderer import HTMLRenderer
+
+    _worker_parser = get_default_parser()
+    _worker_renderer = HTMLRenderer(
+        css=css,
+        show_toc=toc,
+        base_path=base_path,
+        output_dir=output_dir,
+    )
+
+
+def _build_file(md_file: Path, output_file: Path) -> None:
+    """Render a single markdown file with the current worker's renderer."""
+    assert _worker_parser is not None and _worker_renderer is not None
+    _worker_renderer.current_file_path = md_file
+    _worker_renderer.output_file_path = output_file
+    contents = load_file(md_file)
+    metadata, contents = load_metadata(contents)
+    document = _worker_parser.parse(contents)
+    html = _worker_renderer.html(document, metadata)
+    save_file(output_file, html)
+
+
 @main.command()
 @click.argument("input_dir", type=click.Path(exists=True, file_okay=False, path_type=Path))
 @click.option("--output-dir", "-o", type=click.Path(path_type=Path), help="Output directory")
@@ -76,6 +121,7 @@ def render(
     type=click.Path(path_type=Path),
     help="Base path for resolving code references",
 )
+@click.option("--jobs", "-j", type=click.IntRange(min=1), help="Number of worker processes (defaults to the CPU count)")
 def build(
     input_dir: Path,
     output_dir: Optional[Path],
@@ -84,6 +130,7 @@ def build(
     css: Optional[Path],
     toc: bool,
     base_path: Optional[Path],
+    jobs: Optional[int],
 ):
     """Build multiple markdown files in a directory."""
     if output_dir is None:
@@ -101,32 +148,35 @@ def build(
 
     click.echo(f"Found {len(md_files)} markdown files to process...")
 
-    parser = BabblParser()
-
-    for md_file in md_files:
-        try:
-            rel_path = md_file.relative_to(input_dir)
-            output_file = output_dir / rel_path.with_suffix(".html")
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-
-            # Create a renderer for each file to pass the current file path
-            renderer = HTMLRenderer(
-                css_file_path=css,
-                show_toc=toc,
-                base_path=base_path,
-                current_file_path=md_file,
-                output_dir=output_dir,
-                output_file_path=output_file,
-            )
-            contents = load_file(md_file)
-            metadata, contents = load_metadata(contents)
-            document = parser.parse(contents)
-            html = renderer.html(document, metadata)
-            save_file(output_file, html)
-            click.echo(f"✓ {md_file.name} → {output_file}")
-
-        except Exception as e:
-            click.echo(f"✗ Error processing {md_file.name}: {e}", err=True)
-            click.echo(f"Full traceback:\n{traceback.format_exc()}", err=True)
+    try:
+        css_text = load_file(css) if css else None
+    except (OSError, UnicodeDecodeError) as e:
+        click.echo(f"Error reading CSS file: {e}", err=True)
+        raise click.Abort()
+
+    workers = min(jobs or os.cpu_count() or 1, len(md_files))
+    worker_args = (css_text, toc, base_path, output_dir)
+    tasks = [(md_file, output_dir / md_file.relative_to(input_dir).with_suffix(".html")) for md_file in md_files]
+
+    if workers <= 1 or len(tasks) < MIN_PARALLEL_FILES:
+        _init_build_worker(*worker_args)
+        for md_file, output_file in tasks:
+            try:
+                _build_file(md_file, output_file)
+                click.echo(f"✓ {md_file.name} → {output_file}")
+            except Exception as e:
+                click.echo(f"✗ Error processing {md_file.name}: {e}", err=True)
+                click.echo(f"Full traceback:\n{traceback.format_exc()}", err=True)
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_build_worker, initargs=worker_args) as executor:
+            futures = {executor.submit(_build_file, *task): task for task in tasks}
+            for future in as_completed(futures):
+                md_file, output_file = futures[future]
+                try:
+                    future.result()
+                    click.echo(f"✓ {md_file.name} → {output_file}")
+                except Exception as e:
+                    click.echo(f"✗ Error processing {md_file.name}: {e}", err=True)
+                    click.echo(f"Full traceback:\n{traceback.format_exc()}", err=True)
 
     click.echo(f"\nBuild complete! Output directory: {output_dir}")
@@ -10,11 +10,19 @@ if TYPE_CHECKING:
     from marko.source import Source
 
 
+def _line_at(buffer: str, pos: int) -> str:
+    """Return the line starting at pos without copying the rest of the buffer."""
+    end = buffer.find("\n", pos)
+    return buffer[pos:] if end == -1 else buffer[pos:end]
+
+
 class Table(block.BlockElement):
     """Table element for markdown tables."""
 
     priority = 6
     pattern = re.compile(r"^\s*\|.*\|.*$", re.MULTILINE)
+    # header separator row such as |---|:---:|
+    separator_pattern = re.compile(r"^\s*\|[\s\-:|]+\|\s*$")
 
     def __init__(self, headers: List[str], rows: List[List[str]]):
         self.headers = headers
@@ -25,11 +33,12 @@ class Table(block.BlockElement):
     def match(cls, source: "Source") -> bool:
         """Check if the current position contains a table."""
         lines = []
+        buffer = source._buffer
         pos = source.pos
 
         # collect consecutive lines that look like table rows
-        while pos < len(source._buffer):
-            line = source._buffer[pos:].split("\n")[0]
+        while pos < len(buffer):
+            line = _line_at(buffer, pos)
             if not line.strip():
                 break
             if "|" in line and len(line.split("|")) > 2:
@@ -42,7 +51,7 @@ class Table(block.BlockElement):
             return False
 
         # check if there's a header separator
-        has_separator = any(re.match(r"^\s*\|[\s\-:|]+\|\s*$", line) for line in lines)
+        has_separator = any(cls.separator_pattern.match(line) for line in lines)
 
         return has_separator
 
@@ -67,6 +76,16 @@ class Table(block.BlockElement):
             source.pos = start_pos
             raise ValueError("Invalid table structure")
 
+        table = cls._from_lines(lines)
+        if table is None:
+            source.pos = start_pos
+            raise ValueError("Invalid table separator")
+
+        return table
+
+    @classmethod
+    def _from_lines(cls, lines: List[str]) -> Optional["Table"]:
+        """Build a table from its header, separator and data lines, or None if the separator is invalid."""
         # parse headers and separator
         header_line = lines[0]
         separator_line = lines[1]
@@ -77,8 +96,7 @@ class Table(block.BlockElement):
 
         # validate separator
         if not cls._is_valid_separator(separator_line, len(headers)):
-            source.pos = start_pos
-            raise ValueError("Invalid table separator")
+            return None
 
         # parse data rows
         rows = []
@@ -109,19 +127,16 @@ class Table(block.BlockElement):
     @staticmethod
     def _is_valid_separator(line: str, num_columns: int) -> bool:
         """Check if a line is a valid table separator."""
-        if not re.match(r"^\s*\|[\s\-:|]+\|\s*$", line):
+        if not Table.separator_pattern.match(line):
             return False
 
         cells = Table._parse_row(line)
         if len(cells) != num_columns:
             return False
 
-        # check that each cell contains only dashes, colons, and spaces
-        for cell in cells:
-            if not re.match(r"^[\s\-:]+$", cell):
-                return False
-
-        return True
+        # separator_pattern already limits the line to dashes, colons, spaces and pipes,
+        # so each stripped cell only needs to be non-empty
+        return all(cells)
 
 
 class TableHead(Element):
@@ -181,30 +196,13 @@ def parse_table_from_text(text: str) -> Table | None:
     if len(table_lines) < 2:
         return None
 
-    has_separator = any(re.match(r"^\s*\|[\s\-:|]+\|\s*$", line) for line in table_lines)
+    has_separator = any(Table.separator_pattern.match(line) for line in table_lines)
 
     if not has_separator:
         return None
 
     try:
-        header_line = table_lines[0]
-        separator_line = table_lines[1]
-        data_lines = table_lines[2:]
-
-        headers = Table._parse_row(header_line)
-
-        if not Table._is_valid_separator(separator_line, len(headers)):
-            return None
-
-        rows = []
-        for line in data_lines:
-            if line.strip() and "|" in line:
-                row = Table._parse_row(line)
-                while len(row) < len(headers):
-                    row.append("")
-                rows.append(row[: len(headers)])
-
-        return Table(headers, rows)
+        return Table._from_lines(table_lines)
     except Exception:
         return None
 
@@ -218,6 +216,9 @@ class CodeReference(block.BlockElement):
     link_pattern = re.compile(r"^\s*\[([^\]]+)\]\(([^)]*#[a-zA-Z_L][a-zA-Z0-9_\-]*)\)\s*$", re.MULTILINE)
     # pattern for [description](path.html) format - standard markdown links to html files
     html_pattern = re.compile(r"^\s*\[([^\]]+)\]\(([^)]*\.html)\)\s*$", re.MULTILINE)
+    # line references written in the link description, e.g. "see line 12" or "lines 3-8"
+    line_pattern = re.compile(r"line\s+(\d+)")
+    line_range_pattern = re.compile(r"lines\s+(\d+)[-:]\s*(\d+)")
 
     def __init__(self, file_path: str, reference: str, syntax_type: str = "old"):
         self.file_path = file_path
@@ -230,7 +231,7 @@ class CodeReference(block.BlockElement):
         """Check if the current position contains a code reference."""
         if source.exhausted:
             return False
-        line = source._buffer[source.pos :].split("\n")[0].strip()
+        line = _line_at(source._buffer, source.pos).strip()
 
         is_match = bool(cls.link_pattern.match(line)) or bool(cls.html_pattern.match(line))
 
@@ -302,11 +303,11 @@ class CodeReference(block.BlockElement):
             else:
                 desc_lower = description.lower()
                 if "line " in desc_lower:
-                    line_match = re.search(r"line\s+(\d+)", desc_lower)
+                    line_match = cls.line_pattern.search(desc_lower)
                     if line_match:
                         reference = f"line {line_match.group(1)}"
                     else:
-                        range_match = re.search(r"lines\s+(\d+)[-:]\s*(\d+)", desc_lower)
+                        range_match = cls.line_range_pattern.search(desc_lower)
                         if range_match:
                             reference = f"lines {range_match.group(1)}-{range_match.group(2)}"
                         else:
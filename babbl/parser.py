@@ -1,5 +1,7 @@
 """Custom parser with table support for babbl."""
 
+from functools import lru_cache
+
 from marko import Parser
 
 from babbl.elements import CodeReference, Table
@@ -18,3 +20,9 @@ class BabblParser(Parser):
     def parse(self, text: str):
         """Parse text with table and code reference support."""
         return super().parse(text)
+
+
+@lru_cache(maxsize=None)
+def get_default_parser() -> BabblParser:
+    """Get the shared parser instance, parsers keep no per-document state so one can serve every parse."""
+    return BabblParser()
@@ -3,16 +3,21 @@
 from __future__ import annotations
 
 import html
+import os
 import re
+import uuid
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Optional, cast
+from typing import TYPE_CHECKING, Any, Optional
 from urllib.parse import quote
 
 from marko import Renderer
+from marko.block import Paragraph
 
-from babbl.defaults import DEFAULT_CSS
-from babbl.util import extract_code, load_file
+from babbl.defaults import get_default_css
+from babbl.parser import get_default_parser
+from babbl.util import extract_code, load_file, resolve_path
 
 try:
     from latex2mathml.converter import convert as latex_to_mathml
@@ -25,6 +30,54 @@ if TYPE_CHECKING:
     from marko import block, element, inline
 
 
+# display math is tried first so $$...$$ isn't consumed as two empty inline spans
+_MATH_RE = re.compile(r"\$\$([^$]+)\$\$|\$([^$]+)\$")
+
+# converted math, kept verbatim when escaping
+_MATHML_RE = re.compile(r"(<math[^>]*>.*?</math>)")
+
+# heading anchor ids: tags are stripped, then anything but word characters, spaces and dashes
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_ANCHOR_INVALID_RE = re.compile(r"[^\w\s-]")
+_ANCHOR_SEPARATOR_RE = re.compile(r"[-\s]+")
+
+
+@lru_cache(maxsize=1024)
+def _latex_to_mathml_cached(latex: str, display: str = "inline") -> str:
+    """Convert LaTeX to MathML, memoized since the same expressions tend to recur within and across documents."""
+    return latex_to_mathml(latex, display=display)
+
+
+@lru_cache(maxsize=512)
+def _escape_url_cached(raw: str) -> str:
+    """Escape a url, memoized since documents tend to repeat the same links and image paths."""
+    return html.escape(quote(html.unescape(raw), safe="/#:()*?=%@+,&"))
+
+
+@lru_cache(maxsize=None)
+def _get_pygments(style: str = "friendly") -> tuple[Any, Any, Any, str]:
+    """Import Pygments and build the formatter and its style defs once per style, shared by all renderers."""
+    from pygments import highlight  # type: ignore
+    from pygments.formatters import HtmlFormatter  # type: ignore
+    from pygments.lexers import get_lexer_by_name  # type: ignore
+
+    class CodeBlockFormatter(HtmlFormatter):
+        """HtmlFormatter that tags its <pre> with the code-block class used by unhighlighted blocks."""
+
+        def _wrap_pre(self, inner):
+            # the empty span keeps leading blank lines from being dropped, as in HtmlFormatter
+            yield 0, '<pre class="code-block"><span></span>'
+            yield from inner
+            yield 0, "</pre>"
+
+    formatter = CodeBlockFormatter(style=style)
+    return highlight, get_lexer_by_name, formatter, formatter.get_style_defs(".highlight")
+
+
+# pygments lexers by language name, shared by every renderer in the process
+_LEXER_CACHE: dict[str, Any] = {}
+
+
 class BaseRenderer(ABC, Renderer):
     """Strictly specified Renderer base class that plugs into Marko."""
 
@@ -182,6 +235,49 @@ class BaseRenderer(ABC, Renderer):
 class HTMLRenderer(BaseRenderer):
     """Beautiful HTML renderer with clean styling and semantic classes."""
 
+    # well-known frontmatter fields, shown in this order in the header under their capitalized name
+    _HEADER_FIELDS = ("author", "date", "summary", "description", "tags", "categories", "slug", "layout", "draft")
+
+    # page skeleton filled with meta tags, title, css, toc, header and body in that order
+    _DOC_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+%s
+%s
+<style>
+%s
+</style>
+</head>
+<body>
+<div class="container">
+%s
+<main class="content">
+<section>
+%s
+%s
+</section>
+</main>
+</div>
+<script>
+function toggleCodeRef(id) {
+    const content = document.getElementById(id);
+    const header = content.previousElementSibling;
+    const toggle = header.querySelector('.code-ref-toggle');
+    
+    if (content.classList.contains('show')) {
+        content.classList.remove('show');
+        toggle.textContent = '▼';
+    } else {
+        content.classList.add('show');
+        toggle.textContent = '▲';
+    }
+}
+</script>
+</body>
+</html>"""
+
     def __init__(
         self,
         highlight_syntax: bool = True,
@@ -191,6 +287,7 @@ class HTMLRenderer(BaseRenderer):
         current_file_path: Optional[Path] = None,
         output_dir: Optional[Path] = None,
         output_file_path: Optional[Path] = None,
+        css: Optional[str] = None,
     ):
         """
         Initialize the HTML renderer.
@@ -201,68 +298,71 @@ class HTMLRenderer(BaseRenderer):
             show_toc: Whether to show table of contents for h1 headings
             base_path: Base path for resolving code reference file paths
             current_file_path: Path to the current markdown file being processed
+            css: CSS text to use as is, instead of reading css_file_path
         """
         super().__init__()
         self.highlight_syntax = highlight_syntax
         self.pygments_formatter = None
+        self.pygments_css = ""
         self.show_toc = show_toc
         self.toc_headings: list[tuple[str, str]] = []  # track h1 headings for toc
+        # python files under each base path, listed once per document for hash code references
+        self._python_files: dict[Path, list[str]] = {}
         self.base_path = base_path
         self.current_file_path = current_file_path
         self.output_dir = output_dir
         self.output_file_path = output_file_path
 
-        if css_file_path:
+        if css is not None:
+            self.base_css = css
+        elif css_file_path:
             self.base_css = load_file(css_file_path)
         else:
-            self.base_css = DEFAULT_CSS
+            self.base_css = get_default_css()
 
         if self.highlight_syntax:
             try:
-                from pygments import highlight  # type: ignore
-                from pygments.formatters import HtmlFormatter  # type: ignore
-                from pygments.lexers import get_lexer_by_name  # type: ignore
-
-                self.highlight = highlight
-                self.get_lexer_by_name = get_lexer_by_name
-                self.pygments_formatter = HtmlFormatter(style="friendly")
+                self.highlight, self.get_lexer_by_name, self.pygments_formatter, self.pygments_css = _get_pygments()
             except ImportError:
                 self.highlight_syntax = False
 
+        # the stylesheet rarely changes between documents, so get_css assembles it once per base_css
+        self._cached_css_base: Optional[str] = None
+        self._cached_css = ""
+
+    def _get_lexer(self, language: str) -> Any:
+        """Get the Pygments lexer for a language, looking it up in Pygments' registry only once."""
+        lexer = _LEXER_CACHE.get(language)
+        if lexer is None:
+            lexer = _LEXER_CACHE[language] = self.get_lexer_by_name(language)
+        return lexer
+
     @staticmethod
     def _escape_html(raw: str) -> str:
         """Replaces unsafe HTML characters with their escaped equivalents."""
-        return html.escape(html.unescape(raw)).replace("&#x27;", "'")
+        if "&" in raw:
+            # decode entity references first so they aren't double escaped
+            raw = html.unescape(raw).replace("&", "&amp;")
+        # str.replace returns the input untouched when there is nothing to replace
+        return raw.replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
 
     @staticmethod
     def _escape_html_preserve_mathml(raw: str) -> str:
         """Escape HTML but preserve MathML tags."""
-        mathml_tags = []
-        placeholder_pattern = "###MATHML_PLACEHOLDER_{}_###"
-
-        def replace_mathml(match):
-            mathml_tags.append(match.group(0))
-            return placeholder_pattern.format(len(mathml_tags) - 1)
-
-        text = re.sub(r"<math[^>]*>.*?</math>", replace_mathml, raw)
-        text = html.escape(html.unescape(text)).replace("&#x27;", "'")
-
-        for i, mathml_tag in enumerate(mathml_tags):
-            text = text.replace(placeholder_pattern.format(i), mathml_tag)
-
-        return text
+        # the capturing split puts the MathML fragments at the odd indices
+        parts = _MATHML_RE.split(raw)
+        escape = HTMLRenderer._escape_html
+        for i in range(0, len(parts), 2):
+            parts[i] = escape(parts[i])
+        return "".join(parts)
 
     @staticmethod
     def _escape_url(raw: str) -> str:
         """Escape urls to prevent code injection."""
-        return html.escape(quote(html.unescape(raw), safe="/#:()*?=%@+,&"))
+        return _escape_url_cached(raw)
 
     def _resolve_image_url(self, image_path: str) -> str:
         """Resolve relative image paths relative to the current file and output directory."""
-        from pathlib import Path
-
-        from .util import resolve_path
-
         # if it's already an absolute URL or absolute path, return as is
         if image_path.startswith(("http://", "https://", "//", "/")):
             return self._escape_url(image_path)
@@ -281,8 +381,6 @@ class HTMLRenderer(BaseRenderer):
                         return self._escape_url(str(relative_path))
                     except ValueError:
                         # fallback: use os.path.relpath for robust relative path calculation
-                        import os
-
                         rel_path = os.path.relpath(str(resolved_path), str(self.output_file_path.parent))
                         return self._escape_url(rel_path)
                 else:
@@ -300,120 +398,57 @@ class HTMLRenderer(BaseRenderer):
     def html(self, element: element.Element, metadata: dict[str, str] | None) -> str:
         """Converts the base element to HTML with full document structure."""
         self.toc_headings = []
+        self._python_files = {}
 
         content = super().render(element)
+        escape = self._escape_html
         meta_str = (
-            "\n".join(f"<meta name={key} content={value}>" for key, value in metadata.items()) if metadata else ""
+            "\n".join(
+                [f'<meta name="{escape(str(key))}" content="{escape(str(value))}">' for key, value in metadata.items()]
+            )
+            if metadata
+            else ""
         )
 
         toc_html = self.generate_toc() if self.show_toc else ""
 
-        return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="UTF-8">
-<meta name="viewport" content="width=device-width, initial-scale=1.0">
-{meta_str}
-{f"<title>{metadata.get('title', 'Document')}</title>" if metadata else ""}
-<style>
-{self.get_css()}
-</style>
-</head>
-<body>
-<div class="container">
-{toc_html}
-<main class="content">
-<section>
-{self.get_header(metadata) if metadata else ""}
-{content}
-</section>
-</main>
-</div>
-<script>
-function toggleCodeRef(id) {{
-    const content = document.getElementById(id);
-    const header = content.previousElementSibling;
-    const toggle = header.querySelector('.code-ref-toggle');
-    
-    if (content.classList.contains('show')) {{
-        content.classList.remove('show');
-        toggle.textContent = '▼';
-    }} else {{
-        content.classList.add('show');
-        toggle.textContent = '▲';
-    }}
-}}
-</script>
-</body>
-</html>"""
+        if metadata:
+            title_str = f"<title>{escape(str(metadata.get('title', 'Document')))}</title>"
+            header_str = self.get_header(metadata)
+        else:
+            title_str = header_str = ""
+
+        return self._DOC_TEMPLATE % (meta_str, title_str, self.get_css(), toc_html, header_str, content)
 
     def get_css(self) -> str:
         """Get CSS for the rendered HTML."""
-        css = self.base_css
-
-        # add Pygments CSS if available
-        if self.highlight_syntax and self.pygments_formatter:
-            pygments_css = self.pygments_formatter.get_style_defs(".highlight")
-            css += "\n" + pygments_css
-
-        return css
+        if self._cached_css_base is not self.base_css:
+            self._cached_css_base = self.base_css
+            self._cached_css = self.base_css + "\n" + self.pygments_css if self.pygments_css else self.base_css
+        return self._cached_css
 
     def get_header(self, metadata: dict[str, str]) -> str:
         """Get the header of the document."""
         meta = metadata.copy()
-        res = "<header>\n"
+        parts = ["<header>\n"]
         if "title" in meta:
-            title_value = self._process_math_in_metadata(meta["title"])
-            res += f'<h1 class="title">{title_value}</h1>\n'
-            meta.pop("title")
-        res += "<div class='metadata'>\n"
-        if "author" in meta:
-            author_value = self._process_math_in_metadata(meta["author"])
-            res += f'<div class="meta-field">Author: {author_value}</div>\n'
-            meta.pop("author")
-        if "date" in meta:
-            date_value = self._process_math_in_metadata(meta["date"])
-            res += f'<div class="meta-field">Date: {date_value}</div>\n'
-            meta.pop("date")
-        if "summary" in meta:
-            summary_value = self._process_math_in_metadata(meta["summary"])
-            res += f'<div class="meta-field">Summary: {summary_value}</div>\n'
-            meta.pop("summary")
-        if "description" in meta:
-            description_value = self._process_math_in_metadata(meta["description"])
-            res += f'<div class="meta-field">Description: {description_value}</div>\n'
-            meta.pop("description")
-        if "tags" in meta:
-            if isinstance(meta["tags"], list):
-                processed_tags = [self._process_math_in_metadata(str(tag)) for tag in meta["tags"]]
-                res += f'<div class="meta-field">Tags: {", ".join(processed_tags)}</div>\n'
+            title_value = self._process_math_in_metadata(str(meta.pop("title")))
+            parts.append(f'<h1 class="title">{title_value}</h1>\n')
+        parts.append("<div class='metadata'>\n")
+        for key in self._HEADER_FIELDS:
+            if key not in meta:
+                continue
+            value = meta.pop(key)
+            if isinstance(value, list):
+                processed_value = ", ".join(self._process_math_in_metadata(str(item)) for item in value)
             else:
-                tags_value = self._process_math_in_metadata(str(meta["tags"]))
-                res += f'<div class="meta-field">Tags: {tags_value}</div>\n'
-            meta.pop("tags")
-        if "categories" in meta:
-            categories_value = self._process_math_in_metadata(meta["categories"])
-            res += f'<div class="meta-field">Categories: {categories_value}</div>\n'
-            meta.pop("categories")
-        if "slug" in meta:
-            slug_value = self._process_math_in_metadata(meta["slug"])
-            res += f'<div class="meta-field">Slug: {slug_value}</div>\n'
-            meta.pop("slug")
-        if "layout" in meta:
-            layout_value = self._process_math_in_metadata(meta["layout"])
-            res += f'<div class="meta-field">Layout: {layout_value}</div>\n'
-            meta.pop("layout")
-        if "draft" in meta:
-            draft_value = self._process_math_in_metadata(meta["draft"])
-            res += f'<div class="meta-field">Draft: {draft_value}</div>\n'
-            meta.pop("draft")
+                processed_value = self._process_math_in_metadata(str(value))
+            parts.append(f'<div class="meta-field">{key.capitalize()}: {processed_value}</div>\n')
         for key, value in meta.items():
             processed_value = self._process_math_in_metadata(str(value))
-            res += f'<div class="meta-field">{key}: {processed_value}</div>\n'
-        res += "</div>\n"
-        res += "<hr />\n"
-        res += "</header>\n"
-        return res
+            parts.append(f'<div class="meta-field">{key}: {processed_value}</div>\n')
+        parts.append("</div>\n<hr />\n</header>\n")
+        return "".join(parts)
 
     def generate_toc(self) -> str:
         """Generate table of contents HTML from collected h1 headings."""
@@ -451,7 +486,9 @@ function toggleCodeRef(id) {{
         return f'<{tag} class="{css_class}"{extra}>\n{self.render_children(element)}</{tag}>\n'
 
     def render_list_item(self, element: block.ListItem) -> str:
-        if len(element.children) == 1 and getattr(element.children[0], "_tight", False):  # type: ignore
+        children = element.children
+        # marko only marks a list item and its paragraphs tight together, so check the cheap item flag first
+        if element._tight and len(children) == 1 and isinstance(children[0], Paragraph):  # type: ignore
             sep = ""
         else:
             sep = "\n"
@@ -465,13 +502,8 @@ function toggleCodeRef(id) {{
 
         if self.highlight_syntax and element.lang and self.pygments_formatter:
             try:
-                lexer = self.get_lexer_by_name(element.lang)
+                lexer = self._get_lexer(element.lang)
                 highlighted_code = self.highlight(code_content, lexer, self.pygments_formatter)  # type: ignore
-                # ensure proper class structure
-                highlighted_code = highlighted_code.replace(
-                    '<div class="highlight"><pre>',
-                    '<div class="highlight"><pre class="code-block">',
-                )
                 return highlighted_code + "\n"
             except:
                 # fallback to plain code block
@@ -481,8 +513,7 @@ function toggleCodeRef(id) {{
         escaped_code = html.escape(code_content)
         return f'<pre class="code-block"{lang_class}><code>{escaped_code}</code></pre>\n'
 
-    def render_code_block(self, element: block.CodeBlock) -> str:
-        return self.render_fenced_code(cast("block.FencedCode", element))
+    render_code_block = render_fenced_code  # type: ignore[assignment]
 
     def render_html_block(self, element: block.HTMLBlock) -> str:
         return element.body
@@ -494,7 +525,8 @@ function toggleCodeRef(id) {{
         css_class = f"heading-{element.level}"
         heading_text = self.render_children(element)
 
-        clean_heading_text = re.sub(r"<math[^>]*>.*?</math>", "", heading_text)
+        # most headings have no math, so skip the regex unless a MathML tag is present
+        clean_heading_text = _MATHML_RE.sub("", heading_text) if "<math" in heading_text else heading_text
         anchor_id = self._create_anchor_id(clean_heading_text)
 
         # track h1 headings for toc
@@ -503,13 +535,16 @@ function toggleCodeRef(id) {{
 
         return f'<h{element.level} id="{anchor_id}" class="{css_class}">{heading_text}</h{element.level}>\n'
 
+    render_setext_heading = render_heading  # type: ignore[assignment]
+
     def _create_anchor_id(self, text: str) -> str:
         """Create a URL-friendly anchor ID from heading text."""
-        clean_text = re.sub(r"<[^>]+>", "", text)
-        clean_text = html.unescape(clean_text)
+        clean_text = _HTML_TAG_RE.sub("", text) if "<" in text else text
+        if "&" in clean_text:
+            clean_text = html.unescape(clean_text)
 
-        anchor_id = re.sub(r"[^\w\s-]", "", clean_text.lower())
-        anchor_id = re.sub(r"[-\s]+", "-", anchor_id)
+        anchor_id = _ANCHOR_INVALID_RE.sub("", clean_text.lower())
+        anchor_id = _ANCHOR_SEPARATOR_RE.sub("-", anchor_id)
         anchor_id = anchor_id.strip("-")
 
         base_id = anchor_id
@@ -525,37 +560,38 @@ function toggleCodeRef(id) {{
         if not LATEX_AVAILABLE:
             return text
 
-        def replace_inline_math(match):
-            latex_code = match.group(1)
+        def replace_math(match):
+            display_code, inline_code = match.groups()
             try:
-                mathml = latex_to_mathml(latex_code)
-                return mathml
+                if display_code is not None:
+                    # display="block" lays the formula out on its own line without a block
+                    # wrapper that would break the surrounding paragraph or heading
+                    return _latex_to_mathml_cached(display_code, display="block")
+                return _latex_to_mathml_cached(inline_code)
             except Exception:
                 return match.group(0)
 
-        def replace_display_math(match):
-            latex_code = match.group(1)
-            try:
-                mathml = latex_to_mathml(latex_code)
-                return f'<div class="math-display">{mathml}</div>'
-            except Exception:
-                return match.group(0)
-
-        text = re.sub(r"\$([^$]+)\$", replace_inline_math, text)
-        text = re.sub(r"\$\$([^$]+)\$\$", replace_display_math, text)
+        text = _MATH_RE.sub(replace_math, text)
 
         return text
 
     def _process_math_in_metadata(self, text: str) -> str:
         """Process LaTeX math expressions in metadata values and escape HTML."""
-        if not LATEX_AVAILABLE:
+        if not LATEX_AVAILABLE or "$" not in text:
             return self._escape_html(text)
 
         processed_text = self._process_latex_math_text(text)
         return self._escape_html_preserve_mathml(processed_text)
 
-    def render_setext_heading(self, element: block.SetextHeading) -> str:
-        return self.render_heading(cast("block.Heading", element))
+    # render_blank_line and render_link_ref_def always return an empty string, so their elements are
+    # skipped without dispatching
+    _SKIP_TYPES = frozenset({"BlankLine", "LinkRefDef"})
+
+    def render_children(self, element: Any) -> Any:
+        """Render child elements, joined with no separator."""
+        render = self.render
+        skip = self._SKIP_TYPES
+        return "".join([render(child) for child in element.children if type(child).__name__ not in skip])
 
     def render_blank_line(self, element: block.BlankLine) -> str:
         return ""
@@ -570,12 +606,12 @@ function toggleCodeRef(id) {{
         return f'<strong class="strong">{self.render_children(element)}</strong>'
 
     def render_inline_html(self, element: inline.InlineHTML) -> str:
-        return cast(str, element.children)
+        return element.children  # type: ignore
 
     def render_plain_text(self, element: Any) -> str:
         if isinstance(element.children, str):
             text = element.children
-            if LATEX_AVAILABLE:
+            if LATEX_AVAILABLE and "$" in text:
                 text = self._process_latex_math_text(text)
                 return self._escape_html_preserve_mathml(text)
             return self._escape_html(text)
@@ -588,8 +624,7 @@ function toggleCodeRef(id) {{
         body = self.render_children(element)
         return template.format(url, title, body)
 
-    def render_auto_link(self, element: inline.AutoLink) -> str:
-        return self.render_link(cast("inline.Link", element))
+    render_auto_link = render_link  # type: ignore[assignment]
 
     def render_image(self, element: inline.Image) -> str:
         template = '<img src="{}" alt="{}" class="image"{} />'
@@ -598,46 +633,49 @@ function toggleCodeRef(id) {{
         # resolve relative image paths
         url = self._resolve_image_url(element.dest)
 
-        render_func = self.render
-        self.render = self.render_plain_text  # type: ignore
-        body = self.render_children(element)
-        self.render = render_func  # type: ignore
+        body = self._render_plain_children(element)
         return template.format(url, body, title)
 
-    def render_literal(self, element: inline.Literal) -> str:
-        return self.render_raw_text(cast("inline.RawText", element))
+    def _render_plain_children(self, element: Any) -> str:
+        """Render all descendants of an element as escaped plain text, dropping their markup."""
+        render_text = self.render_plain_text
+        render_nested = self._render_plain_children
+        return "".join(
+            [
+                render_text(child) if isinstance(child.children, str) else render_nested(child)
+                for child in element.children
+            ]
+        )
 
     def render_raw_text(self, element: inline.RawText) -> str:
         text = element.children
-        if LATEX_AVAILABLE:
+        # text without a $ has no math, so it skips the latex and mathml-preserving passes
+        if LATEX_AVAILABLE and "$" in text:
             text = self._process_latex_math_text(text)
             return self._escape_html_preserve_mathml(text)
         return self._escape_html(text)
 
+    render_literal = render_raw_text  # type: ignore[assignment]
+
     def render_line_break(self, element: inline.LineBreak) -> str:
         if element.soft:
             return "\n"
         return "<br />\n"
 
     def render_code_span(self, element: inline.CodeSpan) -> str:
-        escaped_code = html.escape(cast(str, element.children))
+        escaped_code = html.escape(element.children)  # type: ignore
         return f'<code class="inline-code">{escaped_code}</code>'
 
     def _render_table_cell_content(self, cell_content: str) -> str:
         """Parse and render markdown content within a table cell."""
-        # Import here to avoid circular imports
-        from marko.element import Element
-
-        from babbl.parser import BabblParser
-
         # If the content contains markdown links, images, or code references, parse it
-        if any(marker in cell_content for marker in ["![", "](", "[", "**", "*", "`"]):
+        # ("![" and "**" are covered by the "[" and "*" checks)
+        if "[" in cell_content or "*" in cell_content or "`" in cell_content or "](" in cell_content:
             try:
-                parser = BabblParser()
                 # Parse the cell content as inline markdown
                 # We need to wrap it in a paragraph context for proper parsing
-                wrapped_content = f"{cell_content.strip()}"
-                parsed = parser.parse(wrapped_content)
+                wrapped_content = cell_content.strip()
+                parsed = get_default_parser().parse(wrapped_content)
 
                 # Render the parsed content and extract just the inner content
                 rendered = self.render(parsed)
@@ -659,25 +697,14 @@ function toggleCodeRef(id) {{
         """Render a table element."""
         # Handle our custom Table element
         if hasattr(element, "headers") and hasattr(element, "rows"):
-            html = '<div class="table-container">\n<table class="table">\n'
-
-            html += "<thead>\n<tr>\n"
-            for header in element.headers:
-                rendered_header = self._render_table_cell_content(header)
-                html += f"<th>{rendered_header}</th>\n"
-            html += "</tr>\n</thead>\n"
-
-            html += "<tbody>\n"
+            render_cell = self._render_table_cell_content
+            parts = ['<div class="table-container">\n<table class="table">\n<thead>\n<tr>\n']
+            parts.extend([f"<th>{render_cell(header)}</th>\n" for header in element.headers])
+            parts.append("</tr>\n</thead>\n<tbody>\n")
             for row in element.rows:
-                html += "<tr>\n"
-                for cell in row:
-                    rendered_cell = self._render_table_cell_content(cell)
-                    html += f"<td>{rendered_cell}</td>\n"
-                html += "</tr>\n"
-            html += "</tbody>\n"
-
-            html += "</table>\n</div>\n"
-            return html
+                parts.append("<tr>\n" + "".join([f"<td>{render_cell(cell)}</td>\n" for cell in row]) + "</tr>\n")
+            parts.append("</tbody>\n</table>\n</div>\n")
+            return "".join(parts)
 
         # Fallback to generic table rendering
         return (
@@ -708,7 +735,14 @@ function toggleCodeRef(id) {{
         """Render a code reference element."""
         # extract code from the referenced file
         syntax_type = getattr(element, "syntax_type", "old")
-        code = extract_code(element.file_path, element.reference, syntax_type, self.base_path, self.current_file_path)
+        code = extract_code(
+            element.file_path,
+            element.reference,
+            syntax_type,
+            self.base_path,
+            self.current_file_path,
+            self._python_files,
+        )
 
         if not code:
             if syntax_type == "hash":
@@ -722,8 +756,6 @@ function toggleCodeRef(id) {{
             return f'<div class="html-inclusion">\n{code}\n</div>\n'
 
         # create a unique id for the dropdown
-        import uuid
-
         dropdown_id = f"code-ref-{uuid.uuid4().hex[:8]}"
 
         # escape the code for HTML
@@ -777,13 +809,8 @@ function toggleCodeRef(id) {{
         # apply syntax highlighting if available
         if self.highlight_syntax and self.pygments_formatter:
             try:
-                lexer = self.get_lexer_by_name(language)
+                lexer = self._get_lexer(language)
                 highlighted_code = self.highlight(code, lexer, self.pygments_formatter)
-                # ensure proper class structure
-                highlighted_code = highlighted_code.replace(
-                    '<div class="highlight"><pre>',
-                    '<div class="highlight"><pre class="code-block">',
-                )
                 code_html = highlighted_code
             except:
                 # fallback to plain code
@@ -2,11 +2,31 @@
 
 import ast
 import glob
+import os
 import re
+from collections import OrderedDict
 from pathlib import Path
+from typing import List, Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore
+
+# plain scalars that yaml resolves to booleans or null rather than strings
+_YAML_SPECIAL_WORDS = frozenset({"true", "false", "yes", "no", "on", "off", "y", "n", "null", "~"})
+_SIMPLE_KEY_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_-]*\Z")
+
+# a line consisting only of `---` (plus surrounding whitespace) delimits frontmatter
+_FRONTMATTER_DELIMITER_RE = re.compile(r"^[^\S\n]*---[^\S\n]*$", re.MULTILINE)
+
+# code reference selectors: "line N", "lines N-M" and the tag name of a referenced html element
+_LINE_REFERENCE_RE = re.compile(r"line\s+(\d+)", re.IGNORECASE)
+_LINE_RANGE_REFERENCE_RE = re.compile(r"lines?\s+(\d+)[-:]\s*(\d+)", re.IGNORECASE)
+_TAG_NAME_RE = re.compile(r"<(\w+)")
+
 
 def load_file(path: Path) -> str:
     """Get the contents of a file as a string."""
@@ -14,11 +34,73 @@ def load_file(path: Path) -> str:
         return f.read()
 
 
+# referenced source files, keyed by path and validated against (st_mtime_ns, st_size);
+# kept to the most recently used few so scanning a large tree doesn't pin every file in memory
+_SOURCE_CACHE_SIZE = 64
+_source_cache: "OrderedDict[str, tuple[tuple[int, int], str]]" = OrderedDict()
+
+
+def load_source_file(path: Path) -> str:
+    """Get the contents of a referenced source file, reusing the last read while it is unchanged.
+
+    A single stat is enough to tell whether the file changed, so documents that reference
+    the same file many times only read it once.
+    """
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    key = str(path)
+    cached = _source_cache.get(key)
+    if cached is not None and cached[0] == version:
+        _source_cache.move_to_end(key)
+        return cached[1]
+    contents = load_file(path)
+    _source_cache[key] = (version, contents)
+    _source_cache.move_to_end(key)
+    if len(_source_cache) > _SOURCE_CACHE_SIZE:
+        _source_cache.popitem(last=False)
+    return contents
+
+
 def save_file(path: Path, contents: str) -> None:
     """Save contents to an HTML file."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(contents)
+    # encode once and write the bytes directly rather than through a text-mode wrapper
+    path.write_bytes(contents.encode("utf-8"))
+
+
+def parse_simple_frontmatter(text: str) -> Optional[dict[str, str]]:
+    """Parse frontmatter made only of `key: value` string pairs without going through yaml.
+
+    Returns None as soon as a line needs the full YAML parser (non-string scalars, collections,
+    comments, escapes, non-ASCII text), so any result returned matches what yaml would produce.
+    """
+    if not text.isascii():
+        return None
+    metadata = {}
+    for line in text.split("\n"):
+        if not line.strip():
+            continue
+        key, sep, value = line.partition(": ")
+        if not sep or not line.isprintable() or not _SIMPLE_KEY_RE.match(key) or key.lower() in _YAML_SPECIAL_WORDS:
+            return None
+        value = value.strip(" ")
+        if value[:1] in ("'", '"'):
+            quote = value[0]
+            inner = value[1:-1]
+            if len(value) < 2 or value[-1] != quote or quote in inner or "\\" in inner:
+                return None
+            metadata[key] = inner
+        elif (
+            value[:1].isalpha()
+            and value.lower() not in _YAML_SPECIAL_WORDS
+            and " #" not in value
+            and ": " not in value
+            and not value.endswith(":")
+        ):
+            metadata[key] = value
+        else:
+            return None
+    return metadata
 
 
 def load_metadata(contents: str) -> tuple[dict[str, str], str]:
@@ -33,46 +115,30 @@ def load_metadata(contents: str) -> tuple[dict[str, str], str]:
     Returns:
         A tuple of (metadata_dict, content_without_frontmatter)
     """
-    lines = contents.split("\n")
-
-    # check if the file starts with frontmatter delimiter
-    if not lines or not lines[0].strip() == "---":
+    # check if the file starts with frontmatter delimiter without splitting the whole document
+    first_line_end = contents.find("\n")
+    if first_line_end == -1 or contents[:first_line_end].strip() != "---":
         return {}, contents
 
-    # find the closing ---
-    frontmatter_lines = []
-    content_lines = []
-    in_frontmatter = True
-
-    for i, line in enumerate(lines[1:], 1):  # start from second line
-        if in_frontmatter:
-            if line.strip() == "---":
-                # found closing delimiter
-                in_frontmatter = False
-                content_lines = lines[i + 1 :]  # Everything after the closing ---
-                break
-            else:
-                frontmatter_lines.append(line)
-        else:
-            content_lines.append(line)
-
-    # if we didn't find a closing ---, there's no valid frontmatter
-    if in_frontmatter:
+    # find the closing ---, if there isn't one there's no valid frontmatter
+    frontmatter_start = first_line_end + 1
+    closing = _FRONTMATTER_DELIMITER_RE.search(contents, frontmatter_start)
+    if closing is None:
         return {}, contents
 
     # parse the frontmatter
     try:
-        frontmatter_text = "\n".join(frontmatter_lines)
-        metadata = yaml.safe_load(frontmatter_text) or {}
-        content = "\n".join(content_lines)
-        return metadata, content
+        frontmatter_text = contents[frontmatter_start : max(closing.start() - 1, frontmatter_start)]
+        metadata = parse_simple_frontmatter(frontmatter_text)
+        if metadata is None:
+            metadata = yaml.load(frontmatter_text, Loader=_YamlLoader) or {}
+        return metadata, contents[closing.end() + 1 :]
     except yaml.YAMLError:
         # if YAML parsing fails, treat as regular content
         return {}, contents
 
 
 # Code reference functions (moved from code_ref.py)
-from typing import List, Optional
 
 
 def resolve_path(file_path: str, base_path: Optional[Path] = None, current_file_path: Optional[Path] = None) -> Path:
@@ -93,15 +159,17 @@ def extract_code(
     syntax_type: str = "link",
     base_path: Optional[Path] = None,
     current_file_path: Optional[Path] = None,
+    python_file_index: Optional[dict[Path, List[str]]] = None,
 ) -> Optional[str]:
     try:
         if syntax_type == "hash" and not file_path:
-            return extract_hash_reference(reference, base_path)
+            return extract_hash_reference(reference, base_path, python_file_index)
         full_path = resolve_path(file_path, base_path, current_file_path)
-        if not full_path.exists():
+        try:
+            content = load_source_file(full_path)
+        except OSError:
+            # missing or unreadable file
             return None
-        with open(full_path, "r", encoding="utf-8") as f:
-            content = f.read()
         if file_path.lower().endswith(".html"):
             return extract_html_content(content, reference)
         lines = content.split("\n")
@@ -136,7 +204,7 @@ def extract_by_function_class(lines: List[str], reference: str) -> Optional[str]
 
 
 def extract_by_line_numbers(lines: List[str], reference: str) -> Optional[str]:
-    line_match = re.match(r"line\s+(\d+)", reference, re.IGNORECASE)
+    line_match = _LINE_REFERENCE_RE.match(reference)
     if line_match:
         line_num = int(line_match.group(1)) - 1
         if 0 <= line_num < len(lines):
@@ -145,7 +213,7 @@ def extract_by_line_numbers(lines: List[str], reference: str) -> Optional[str]:
 
 
 def extract_by_line_range(lines: List[str], reference: str) -> Optional[str]:
-    range_match = re.match(r"lines?\s+(\d+)[-:]\s*(\d+)", reference, re.IGNORECASE)
+    range_match = _LINE_RANGE_REFERENCE_RE.match(reference)
     if range_match:
         start_line = int(range_match.group(1)) - 1
         end_line = int(range_match.group(2))
@@ -169,14 +237,28 @@ def find_block_end(lines: List[str], start_line: int, node: ast.AST) -> int:
     return len(lines)
 
 
-def extract_hash_reference(reference: str, base_path: Optional[Path] = None) -> Optional[str]:
+def find_python_files(base: Path, index: Optional[dict[Path, List[str]]] = None) -> List[str]:
+    """List the python files under base, reusing the listing stored in index when one is given.
+
+    The caller owns the index and decides how long a listing stays valid, e.g. for one rendered document.
+    """
+    if index is None:
+        return glob.glob(str(base / "**/*.py"), recursive=True)
+    files = index.get(base)
+    if files is None:
+        files = index[base] = glob.glob(str(base / "**/*.py"), recursive=True)
+    return files
+
+
+def extract_hash_reference(
+    reference: str, base_path: Optional[Path] = None, python_file_index: Optional[dict[Path, List[str]]] = None
+) -> Optional[str]:
     base = base_path or Path.cwd()
-    search_pattern = str(base / "**/*.py")
-    for file_path in glob.glob(search_pattern, recursive=True):
+    for file_path in find_python_files(base, python_file_index):
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-                lines = content.split("\n")
+            # read directly: a scan visits every file once, so caching would only evict linked files
+            content = load_file(Path(file_path))
+            lines = content.split("\n")
             code = extract_by_function_class(lines, reference)
             if code:
                 return code
@@ -207,7 +289,7 @@ def extract_html_content(content: str, reference: str) -> Optional[str]:
         match = re.search(pattern, content, re.IGNORECASE)
         if match:
             start_pos = match.start()
-            tag_name_match = re.match(r"<(\w+)", match.group())
+            tag_name_match = _TAG_NAME_RE.match(match.group())
             if tag_name_match:
                 tag_name = tag_name_match.group(1)
                 end_pattern = rf"</{tag_name}>"
@@ -223,11 +305,11 @@ def get_file_info(
 ) -> Optional[dict]:
     try:
         full_path = resolve_path(file_path, base_path, current_file_path)
-        if not full_path.exists():
+        try:
+            content = load_source_file(full_path)
+        except OSError:
             return None
-        with open(full_path, "r", encoding="utf-8") as f:
-            content = f.read()
-            lines = content.split("\n")
+        lines = content.split("\n")
         tree = ast.parse(content)
         functions = []
         classes = []